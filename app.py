@@ -1,38 +1,24 @@
+import os
 import argparse
-import platform
+import functools
 from pathlib import Path
 
-import gradio as gr
-
+from backends import BACKEND_MODELS
 from cli import run_cli
 
-from tabs import create_asr_tab, create_split_audio_tab
-
 demix_choices = ["UVR-MDX-NET Inst HQ4", "UVR-MDX-NET-Voc_FT", "htdemucs"]
-asr_backend_choices = ["transformers", "faster-whisper", "whisper", "speech-recognition", "sherpa-onnx"]
+asr_backend_choices = tuple(BACKEND_MODELS)
 language_choices = ["zh", "en", "ja", "ko", "auto"]
 
-model_size_options = {
-    "transformers": ["tiny", "base", "small", "medium", "large"],
-    "faster-whisper": ["tiny", "base", "small", "medium", "large-v2", "large-v3"],
-    "whisper": ["tiny", "base", "small", "medium", "large"],
-    "speech-recognition": ["google"],
-    "sherpa-onnx": ["zipformer"]
-}
+model_size_options = BACKEND_MODELS
 
-if platform.system() == "Darwin":
-    # macOS specific settings
-    asr_backend_choices.append("mlx-whisper")
-    model_size_options["mlx-whisper"] = [
-        "tiny", "tiny.en", "base", "base.en", "small", "small.en",
-        "medium", "medium.en", "large-v1", "large-v2", "large-v3",
-        "large-v3-turbo", "large"
-    ]
 
+@functools.lru_cache(maxsize=None)
+def _backend_updates(backend):
+    import gradio as gr
 
-def update_backend_options(backend):
     model_update = gr.update(
-        choices=model_size_options[backend],
+        choices=list(model_size_options[backend]),
         value=model_size_options[backend][0],
     )
     language_update = gr.update(
@@ -41,9 +27,21 @@ def update_backend_options(backend):
     return model_update, language_update
 
 
+def update_backend_options(backend):
+    # Gradio pops "value" from update dicts while postprocessing them, so
+    # hand out shallow copies of the cached payloads.
+    model_update, language_update = _backend_updates(backend)
+    return dict(model_update), dict(language_update)
+
+
 def build_demo():
+    # Gradio (and the tabs built on it) are only imported in web mode, so
+    # CLI runs don't pay for loading fastapi, uvicorn, etc.
+    import gradio as gr
+    from tabs import create_asr_tab, create_split_audio_tab
+
     # Create a Gradio interface
-    with gr.Blocks() as app:
+    with gr.Blocks(analytics_enabled=False) as app:
         # UI Parts
         gr.Markdown("## 🧠 Multi-ASR Toolkit - 語音轉文字平台")
         with gr.Tabs():
@@ -79,7 +77,12 @@ def main():
         # Launch the app
         # Gradio defaults to localhost:7860
         demo = build_demo()
-        demo.queue()
+        # Run independent transcription jobs in parallel and bound the
+        # number of waiting requests.
+        demo.queue(
+            default_concurrency_limit=max(1, (os.cpu_count() or 1) // 4),
+            max_size=32,
+        )
         # To create a public link, set share=True
         demo.launch()
 
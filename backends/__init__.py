@@ -1,35 +1,96 @@
 import os
 import sys
 import platform
+import functools
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 proj_root = sys.path[0]
 model_dir = os.path.join(proj_root, "models", "korean_zipformer")
 
+IS_DARWIN = platform.system() == "Darwin"
 
-from .asr.transformers_backend import TransformersBackend
-from .asr.speech_recognition_backend import SpeechRecognitionBackend
-from .asr.whisper_backend import WhisperBackend
-from .asr.faster_whisper_backend import FasterWhisperBackend
-from .asr.sherpa_onnx_beckend import SherpaOnnxBackend
+# Available model sizes per backend; mlx-whisper is only offered on macOS.
+BACKEND_MODELS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "transformers": ("tiny", "base", "small", "medium", "large"),
+    "faster-whisper": (
+        "tiny", "base", "small", "medium", "large-v2", "large-v3"
+    ),
+    "whisper": ("tiny", "base", "small", "medium", "large"),
+    "speech-recognition": ("google",),
+    "sherpa-onnx": ("zipformer",),
+    **({
+        "mlx-whisper": (
+            "tiny", "tiny.en", "base", "base.en", "small", "small.en",
+            "medium", "medium.en", "large-v1", "large-v2", "large-v3",
+            "large-v3-turbo", "large"
+        )
+    } if IS_DARWIN else {}),
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _cpu_has_fast_int8() -> bool:
+    """
+    Whether the CPU has int8 dot-product instructions (VNNI / ARM dotprod).
+
+    Without them ONNX Runtime's int8 kernels can be slower than fp32.
+    """
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            flags = set(f.read().split())
+    except OSError:
+        # Cannot probe (e.g. macOS); keep the int8 models.
+        return True
+    return bool(flags & {"avx512_vnni", "avx_vnni", "asimddp"})
+
+
+def _zipformer_model_path(name: str) -> str:
+    """
+    Returns the int8 or fp32 model file for `name`, whichever suits the CPU.
+
+    A pre-optimized `.ort` file (see tools/convert_to_ort.py) is preferred
+    over the `.onnx` of the same variant, since it skips graph optimization
+    when the session is created.
+    """
+    variants = [f"{name}.int8", name]
+    if not _cpu_has_fast_int8():
+        variants.reverse()
+    candidates = [
+        os.path.join(model_dir, f"{variant}{ext}")
+        for variant in variants
+        for ext in (".ort", ".onnx")
+    ]
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return candidates[1]
 
 
 def get_asr_backend(name: str, **kwargs):
     name = name.lower()
+    # Backends are imported lazily so that only the selected engine's
+    # dependencies (torch, transformers, ctranslate2, ...) get loaded.
     if name == "transformers":
+        from .asr.transformers_backend import TransformersBackend
         return TransformersBackend(**kwargs)
     elif name == "speech-recognition":
+        from .asr.speech_recognition_backend import SpeechRecognitionBackend
         return SpeechRecognitionBackend(**kwargs)
     elif name == "whisper":
+        from .asr.whisper_backend import WhisperBackend
         return WhisperBackend(**kwargs)
     elif name == "faster-whisper":
+        from .asr.faster_whisper_backend import FasterWhisperBackend
         return FasterWhisperBackend(**kwargs)
-    elif name == "mlx-whisper" and platform.system() == "Darwin":
+    elif name == "mlx-whisper" and IS_DARWIN:
         from .asr.mlx_whisper_backend import MLXWhisperBackend
         return MLXWhisperBackend(**kwargs)
     elif name == "sherpa-onnx":
-        enc = os.path.join(model_dir, "encoder-epoch-99-avg-1.int8.onnx")
-        dec = os.path.join(model_dir, "decoder-epoch-99-avg-1.int8.onnx")
-        joi = os.path.join(model_dir, "joiner-epoch-99-avg-1.int8.onnx")
+        from .asr.sherpa_onnx_beckend import SherpaOnnxBackend
+        enc = _zipformer_model_path("encoder-epoch-99-avg-1")
+        dec = _zipformer_model_path("decoder-epoch-99-avg-1")
+        joi = _zipformer_model_path("joiner-epoch-99-avg-1")
         tok = os.path.join(model_dir, "tokens.txt")
 
         # Zipformer-Transducer
@@ -1,61 +1,243 @@
-from typing import Any
+import os
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional
 
+import av
+import numpy as np
 import torch
 from faster_whisper import WhisperModel
+from faster_whisper.audio import decode_audio, pad_or_trim
+from faster_whisper.tokenizer import Tokenizer
 
 from .base import ASRBackend
 from utils.dataclasses import ASRToken, ASRSegment, ASRResult
 
 
+@functools.lru_cache(maxsize=4)
+def _get_faster_whisper_model(
+    model_size, device, compute_type, cpu_threads, num_workers
+):
+    """Load a WhisperModel once per configuration."""
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers
+    )
+
+
+def clear_model_cache():
+    """Drop all cached WhisperModel instances so their memory can be freed."""
+    _get_faster_whisper_model.cache_clear()
+
+
+def _probe_duration(audio_path: str) -> Optional[float]:
+    """Reads the duration in seconds from container metadata, or None if unknown."""
+    try:
+        with av.open(audio_path, metadata_errors="ignore") as container:
+            if container.duration is not None:
+                return container.duration / av.time_base
+            stream = container.streams.audio[0]
+            if stream.duration is not None and stream.time_base is not None:
+                return float(stream.duration * stream.time_base)
+    except (av.FFmpegError, IndexError):
+        pass
+    return None
+
+
+# Languages detected for auto-language runs, keyed by (audio_path, mtime), so
+# re-transcribing the same file skips the language-detection encoder pass.
+# Least recently used first, capped so a long-running app doesn't grow it
+# without bound.
+_MAX_DETECTED_LANGUAGES = 256
+_detected_languages = OrderedDict()
+# Shared by concurrent Gradio workers
+_detected_languages_lock = threading.Lock()
+
+
 class FasterWhisperBackend(ASRBackend):
     def __init__(
         self,
         model_size="base",
-        device="cpu",
-        compute_type="float32",
-        language="auto"
+        device=None,
+        compute_type=None,
+        language="auto",
+        beam_size=1,
+        vad_filter=True,
+        cpu_threads=None,
+        num_workers=None
     ):
         super().__init__(language, model_size)
 
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.compute_type = "float16" if self.device == "cuda" else "int8"
+        # None means auto-select: CUDA if available, and CTranslate2's
+        # fastest quantized compute type for that device.
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        if compute_type is None:
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+        self.device = device
+        self.compute_type = compute_type
+        self.beam_size = beam_size
+        self.vad_filter = vad_filter
+
+        # Thread tuning for CTranslate2; overridable via environment so
+        # deployments can match the host without code changes.
+        if cpu_threads is None:
+            cpu_threads = int(
+                os.getenv("ASR_CPU_THREADS", min(8, os.cpu_count() or 1))
+            )
+        if num_workers is None:
+            num_workers = int(os.getenv("ASR_NUM_WORKERS", 2))
 
-        self.model = WhisperModel(
-            model_size,
-            device=device,
-            compute_type=compute_type
+        self.model = _get_faster_whisper_model(
+            model_size, self.device, self.compute_type, cpu_threads, num_workers
         )
 
-    def transcribe(self, audio_path: str, word_timestamps: bool = True) -> Any:
+    def transcribe(
+        self,
+        audio_path: str,
+        word_timestamps: bool = True,
+        vad_filter: Optional[bool] = None
+    ) -> Any:
+        """
+        Calls faster-whisper and returns the lazy segment generator and info.
+
+        Decoding happens while `to_asr_result` iterates the generator, which
+        may therefore be consumed only once. `vad_filter` overrides the
+        backend's setting for this call when given.
+        """
+        if vad_filter is None:
+            vad_filter = self.vad_filter
+        language = self.language
+        if language is None:
+            cache_key = (audio_path, os.path.getmtime(audio_path))
+            with _detected_languages_lock:
+                language = _detected_languages.get(cache_key)
+                if language is not None:
+                    _detected_languages.move_to_end(cache_key)
+
         segments, info = self.model.transcribe(
             audio_path,
-            language=self.language,
-            beam_size=5,
+            language=language,
+            beam_size=self.beam_size,
+            vad_filter=vad_filter,
+            vad_parameters={"min_silence_duration_ms": 500},
+            # Don't feed previous output back as the prompt; this avoids
+            # repetition loops on long audio.
+            condition_on_previous_text=False,
             word_timestamps=word_timestamps
         )
+        if self.language is None and language is None:
+            with _detected_languages_lock:
+                _detected_languages[cache_key] = info.language
+                while len(_detected_languages) > _MAX_DETECTED_LANGUAGES:
+                    _detected_languages.popitem(last=False)
+
+        return segments, info
+
+    def transcribe_batch(
+        self, audio_paths: List[str], batch_size: int = 8
+    ) -> List[ASRResult]:
+        """
+        Transcribes several short clips with batched CTranslate2 generation.
+
+        Clips up to 30 seconds (one Whisper window) are encoded and decoded
+        together, `batch_size` at a time; longer clips fall back to
+        `transcribe`. Each clip yields a single segment without word
+        timestamps. Results are returned in the order of `audio_paths`.
+        """
+        fe = self.model.feature_extractor
+        results: List[ASRResult] = [None] * len(audio_paths)
+
+        # Container metadata is enough to route long clips to `transcribe`
+        # without decoding them here first.
+        window_sec = fe.n_samples / fe.sampling_rate
+        short_clips = []
+        for i, path in enumerate(audio_paths):
+            duration = _probe_duration(path)
+            audio = None
+            if duration is None or duration <= window_sec:
+                audio = decode_audio(path, sampling_rate=fe.sampling_rate)
+                duration = len(audio) / fe.sampling_rate
+            if duration > window_sec:
+                results[i] = self.to_asr_result(
+                    self.transcribe(path, word_timestamps=False)
+                )
+            else:
+                short_clips.append((i, audio, duration))
+
+        for b in range(0, len(short_clips), batch_size):
+            batch = short_clips[b:b + batch_size]
+            # Whisper's encoder always consumes a full 30s window, so every
+            # clip is padded to the same number of frames.
+            features = np.stack([
+                pad_or_trim(fe(audio)[:, :fe.nb_max_frames], fe.nb_max_frames)
+                for _, audio, _ in batch
+            ])
+            encoder_output = self.model.encode(features)
+
+            if self.language is None and self.model.model.is_multilingual:
+                detected = self.model.model.detect_language(encoder_output)
+                languages = [d[0][0][2:-2] for d in detected]
+            else:
+                languages = [self.language or "en"] * len(batch)
+
+            tokenizers = [
+                Tokenizer(
+                    self.model.hf_tokenizer,
+                    self.model.model.is_multilingual,
+                    task="transcribe",
+                    language=language,
+                )
+                for language in languages
+            ]
+            prompts = [
+                self.model.get_prompt(tokenizer, [], without_timestamps=True)
+                for tokenizer in tokenizers
+            ]
+
+            outputs = self.model.model.generate(
+                encoder_output,
+                prompts,
+                beam_size=self.beam_size,
+                max_length=self.model.max_length,
+                suppress_blank=True,
+            )
+
+            for (i, _, duration), language, tokenizer, output in zip(
+                batch, languages, tokenizers, outputs
+            ):
+                text = tokenizer.decode(output.sequences_ids[0])
+                results[i] = ASRResult(
+                    text=text.strip(),
+                    segments=[ASRSegment(start=0.0, end=duration, text=text)],
+                    language=language
+                )
 
-        return list(segments), info
+        return results
 
     def to_asr_result(self, result: Any) -> ASRResult:
         raw_segments, info = result
         language = info.language
 
         segments = []
-        full_text = ""
+        text_parts = []
         for seg in raw_segments:
-            if hasattr(seg, 'no_speech_prob') and seg.no_speech_prob > 0.9:
+            if seg.no_speech_prob is not None and seg.no_speech_prob > 0.9:
                 continue
 
-            tokens = []
-            if hasattr(seg, 'words'):
-                tokens = [
-                    ASRToken(
-                        start=word.start,
-                        end=word.end,
-                        token=word.word,
-                        probability=word.probability
-                    ) for word in seg.words
-                ]
+            # `words` is None unless word_timestamps was requested.
+            tokens = [
+                ASRToken(
+                    start=word.start,
+                    end=word.end,
+                    token=word.word,
+                    probability=word.probability
+                ) for word in seg.words or []
+            ]
 
             segment = ASRSegment(
                 start=seg.start,
@@ -64,10 +246,10 @@ class FasterWhisperBackend(ASRBackend):
                 tokens=tokens
             )
             segments.append(segment)
-            full_text += seg.text
+            text_parts.append(seg.text)
 
         return ASRResult(
-            text=full_text.strip(),
+            text="".join(text_parts).strip(),
             segments=segments,
             language=language
         )
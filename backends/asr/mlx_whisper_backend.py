@@ -1,6 +1,8 @@
 from typing import Any
 
+import mlx.core as mx
 import mlx_whisper
+from mlx_whisper.transcribe import ModelHolder
 
 from .base import ASRBackend
 from utils.dataclasses import ASRResult, ASRSegment, ASRToken
@@ -9,6 +11,10 @@ from utils.dataclasses import ASRResult, ASRSegment, ASRToken
 class MLXWhisperBackend(ASRBackend):
     def __init__(self, model_size="base", language="auto"):
         super().__init__(language, model_size)
+        # mlx_whisper.transcribe() takes the model by path and looks it up
+        # in ModelHolder, so loading it here keeps weights out of the
+        # per-request path (transcribe uses float16 by default).
+        ModelHolder.get_model(self.model_size, mx.float16)
 
     def transcribe(self, audio_path: str, word_timestamps: bool = True) -> Any:
         """
@@ -1,6 +1,10 @@
+from typing import Optional
+
 import sherpa_onnx
 import numpy as np
 
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
 
 class SherpaOnnxBackend:
     def __init__(self, model_configs: dict):
@@ -15,6 +19,9 @@ class SherpaOnnxBackend:
             sampling_rate: Expected sample rate of input audio (default: 16000)
             feature_dim: Feature dimension (default: 80 for fbank)
             provider: "cuda" or "cpu" (default: "cuda")
+            device: CUDA device index when provider is "cuda" (default: 0)
+            cudnn_conv_algo_search: cuDNN conv algorithm search for the CUDA
+                provider, 0=exhaustive, 1=heuristic, 2=default (default: 1)
             num_threads: int (default: 2)
             decoding_method: "greedy_search" | "modified_beam_search" | "fast_beam_search"
             max_active_paths: int (beam size for modified_beam_search)
@@ -26,6 +33,8 @@ class SherpaOnnxBackend:
         self.sample_rate=int(model_configs.get("sampling_rate", 16000))
         self.feature_dim=int(model_configs.get("feature_dim", 80))
         self.provider=model_configs.get("provider", "cuda")
+        self.device=int(model_configs.get("device", 0))
+        self.cudnn_conv_algo_search=int(model_configs.get("cudnn_conv_algo_search", 1))
         self.num_threads=int(model_configs.get("num_threads", 2))
         self.decoding_method=model_configs.get("decoding_method", "modified_beam_search")
         self.max_active_paths=int(model_configs.get("max_active_paths", 4))
@@ -39,12 +48,16 @@ class SherpaOnnxBackend:
             sample_rate=self.sample_rate,
             feature_dim=self.feature_dim,
             provider=self.provider,
+            device=self.device,
+            cudnn_conv_algo_search=self.cudnn_conv_algo_search,
             num_threads=self.num_threads,
             decoding_method=self.decoding_method,
             max_active_paths=self.max_active_paths,
         )
         self.stream = self.recognizer.create_stream()
         self.expected_sr = self.sample_rate
+        # reset() keeps the same stream object, so the bound method stays valid
+        self._accept_waveform = self.stream.accept_waveform
 
     def _to_text(self, result) -> str:
         """Handle sherpa-onnx versions where get_result() may return str or an object."""
@@ -54,20 +67,41 @@ class SherpaOnnxBackend:
 
     # --- Simple inputs ---
     def accept_pcm16_bytes(self, raw_bytes: bytes, sample_rate: int = 16000) -> None:
-        """假設 raw_bytes 是 mono s16le，且已對齊（長度為 2 的倍數）"""
+        """
+        假設 raw_bytes 是 mono s16le，且已對齊（長度為 2 的倍數）。
+
+        可傳入 bytes、bytearray 或 memoryview 切片；np.frombuffer 直接取用其緩衝區，不會複製。
+        """
         if sample_rate != self.expected_sr:
             raise ValueError(f"Expected {self.expected_sr} Hz, got {sample_rate}")
-        f32 = np.frombuffer(raw_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-        f32 = np.ascontiguousarray(f32, dtype=np.float32)
+        # Cast and scale in a single ufunc pass; the output is already a
+        # contiguous float32 array.
+        f32 = np.multiply(
+            np.frombuffer(raw_bytes, dtype=np.int16), _PCM16_SCALE,
+            dtype=np.float32
+        )
         self.stream.accept_waveform(sample_rate, f32)
 
+    def accept_pcm16_bytes_fast(self, raw_bytes) -> None:
+        """
+        與 accept_pcm16_bytes 相同，但省略取樣率檢查。
+
+        僅供已確認輸入取樣率等於 expected_sr 的呼叫端（如 StreamingTranscriber）在熱路徑使用。
+        """
+        self._accept_waveform(
+            self.expected_sr,
+            np.multiply(
+                np.frombuffer(raw_bytes, dtype=np.int16), _PCM16_SCALE,
+                dtype=np.float32
+            ),
+        )
+
     def accept_waveform_float32(self, f32: np.ndarray, sample_rate: int = 16000) -> None:
         """已經是 [-1,1] 的 float32（單聲道）"""
         if sample_rate != self.expected_sr:
             raise ValueError(f"Expected {self.expected_sr} Hz, got {sample_rate}")
-        if f32.dtype != np.float32:
-            f32 = f32.astype(np.float32, copy=False)
-        f32 = np.ascontiguousarray(f32, dtype=np.float32)
+        if f32.dtype != np.float32 or not f32.flags.c_contiguous:
+            f32 = np.ascontiguousarray(f32, dtype=np.float32)
         self.stream.accept_waveform(sample_rate, f32)
 
     def input_finished(self) -> None:
@@ -76,6 +110,10 @@ class SherpaOnnxBackend:
     def is_endpoint(self) -> bool:
         return self.recognizer.is_endpoint(self.stream)
 
+    def is_ready(self) -> bool:
+        """Whether enough frames have been fed for another decoding step."""
+        return self.recognizer.is_ready(self.stream)
+
     # --- Decoding ---
     def decode(self) -> str:
         """Perform decoding and return the current result text."""
@@ -84,6 +122,20 @@ class SherpaOnnxBackend:
         result = self.recognizer.get_result(self.stream)
         return self._to_text(result)
 
+    def decode_if_ready(self) -> Optional[str]:
+        """
+        Decode pending frames and return the updated text.
+
+        Returns None, without fetching the result, when no decoding step ran;
+        the text is then unchanged since the last call.
+        """
+        if not self.recognizer.is_ready(self.stream):
+            return None
+        while self.recognizer.is_ready(self.stream):
+            self.recognizer.decode_stream(self.stream)
+        result = self.recognizer.get_result(self.stream)
+        return self._to_text(result)
+
     def get_partial(self) -> str:
         result = self.recognizer.get_result(self.stream)
         return self._to_text(result)
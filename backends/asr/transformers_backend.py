@@ -1,24 +1,51 @@
 from typing import Any
 
+import torch
 from transformers import pipeline
 
 from .base import ASRBackend
 from utils.dataclasses import ASRResult, ASRSegment
 
 
+def _default_batch_size(device: int) -> int:
+    """
+    Pick how many 30s windows to run per forward pass.
+
+    On GPU this scales with the currently free memory (roughly 512 MiB per
+    fp16 window, capped at 32); on CPU batching buys little, so keep 8.
+    """
+    if device < 0:
+        return 8
+    try:
+        free_bytes, _ = torch.cuda.mem_get_info(device)
+    except RuntimeError:
+        return 8
+    return max(1, min(32, free_bytes // (512 * 1024 * 1024)))
+
+
 class TransformersBackend(ASRBackend):
     def __init__(
         self,
         model_size="openai/whisper-small",
-        device=-1,
-        language="auto"
+        device=None,
+        language="auto",
+        batch_size=None,
     ):
         super().__init__(language)
+        if device is None:
+            device = 0 if torch.cuda.is_available() else -1
+        if batch_size is None:
+            batch_size = _default_batch_size(device)
         self.asr = pipeline(
             task="automatic-speech-recognition",
             model=model_size,
             device=device,   # -1 for CPU, 0 for GPU
             framework="pt",  # "tf" for TensorFlow, "pt" for PyTorch
+            torch_dtype=torch.float16 if device >= 0 else torch.float32,
+            # Split long audio into 30s windows and run them in batches
+            chunk_length_s=30,
+            stride_length_s=(6, 0),
+            batch_size=batch_size,
         )
 
     def transcribe(self, audio_path: str, word_timestamps: bool = True) -> Any:
@@ -1,15 +1,17 @@
 from typing import Any
 
+import torch
 import whisper
 
 from .base import ASRBackend
-from utils.dataclasses import ASRResult, ASRSegment, ASRToken
+from utils.dataclasses import ASRResult, ASRResultArrays, ASRSegment
 
 
 class WhisperBackend(ASRBackend):
     def __init__(self, model_size="base", language="auto"):
         super().__init__(language, model_size)
-        self.model = whisper.load_model(model_size)
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.model = whisper.load_model(model_size, device=self.device)
 
     def transcribe(self, audio_path: str, word_timestamps: bool = True) -> Any:
         """
@@ -18,7 +20,8 @@ class WhisperBackend(ASRBackend):
         result = self.model.transcribe(
             audio_path,
             language=self.language,
-            word_timestamps=word_timestamps
+            word_timestamps=word_timestamps,
+            fp16=(self.device == "cuda")
         )
         return result
 
@@ -27,28 +30,20 @@ class WhisperBackend(ASRBackend):
         Converts the raw dictionary result from whisper
         into our standard ASRResult object.
         """
-        segments = []
-        for seg_data in result.get("segments", []):
-            words_data = seg_data.get("words", [])
-            tokens = [
-                ASRToken(
-                    start=word.get("start"),
-                    end=word.get("end"),
-                    token=word.get("word"),
-                    probability=word.get("probability")
-                ) for word in words_data if word.get("start") is not None
-            ]
-
-            segment = ASRSegment(
+        raw_segments = result.get("segments", [])
+        # Word-level tokens are kept column-wise instead of one ASRToken per word
+        segments = [
+            ASRSegment(
                 start=seg_data.get("start"),
                 end=seg_data.get("end"),
                 text=seg_data.get("text", ""),
-                tokens=tokens
             )
-            segments.append(segment)
+            for seg_data in raw_segments
+        ]
 
         return ASRResult(
             text=result.get("text", "").strip(),
             segments=segments,
-            language=result.get("language")
+            language=result.get("language"),
+            arrays=ASRResultArrays.from_segments(raw_segments),
         )
@@ -1,11 +1,12 @@
 import argparse
-from core.transcription import transcribe_audio
+from core.transcription import transcribe_audio, transcribe_audio_batch
 
 
 def run_cli(args):
     parser = argparse.ArgumentParser(description="Run Multi-ASR Toolkit in CLI mode")
 
-    parser.add_argument("audio_path", help="輸入的音訊檔案路徑（支援 mp3, wav 等）")
+    parser.add_argument("audio_path", nargs="+",
+                        help="輸入的音訊檔案路徑（支援 mp3, wav 等），可指定多個檔案一次批次處理")
     parser.add_argument("--backend", choices=["transformers", "faster-whisper", "whisper", "speech-recognition"],
                         default="transformers", help="選擇辨識後端")
     parser.add_argument("--language", default="auto", help="語音語言（如 zh, en, ja, ko）")
@@ -15,11 +16,24 @@ def run_cli(args):
 
     # transcribe audio
     print(f"[INFO] 使用 {args.backend} 後端進行辨識...")
-    text, _ = transcribe_audio(
-        audio_input=args.audio_path,
+    if len(args.audio_path) == 1:
+        text, _ = transcribe_audio(
+            audio_input=args.audio_path[0],
+            backend=args.backend,
+            language=args.language,
+            model_size=args.model_size
+        )
+        print("\n📝 辨識結果：\n")
+        print(text)
+        return
+
+    # 多個檔案：支援批次推論的後端會將短音檔合併處理
+    results = transcribe_audio_batch(
+        args.audio_path,
         backend=args.backend,
         language=args.language,
         model_size=args.model_size
     )
-    print("\n📝 辨識結果：\n")
-    print(text)
+    for audio_path, (text, _) in zip(args.audio_path, results):
+        print(f"\n📝 辨識結果（{audio_path}）：\n")
+        print(text)
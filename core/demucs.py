@@ -1,68 +1,138 @@
-from pathlib import Path
+import os
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Union
+
 import torch
 from backends.demucs.api import Separator, save_audio
 
 
-def demix_audio(audio_path: Path, model_name: str, output_dir: Path):
+# Demucs 以固定長度的 segment 推論，讓 cuDNN 為這些形狀挑選最快的演算法
+if torch.cuda.is_available():
+    torch.backends.cudnn.benchmark = True
+
+# 在 CUDA 上以 FP16 autocast 執行分離；設定 DEMUCS_FP16=0 可關閉
+_use_fp16 = os.environ.get("DEMUCS_FP16", "1") != "0"
+
+# 上傳檔案時在背景預先載入 Separator；key 為 (model_name, device)
+_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="demucs-load")
+_prefetch_futures = {}
+
+
+def _default_device() -> str:
+    return 'cuda' if torch.cuda.is_available() else 'cpu'
+
+
+@functools.lru_cache(maxsize=2)
+def _get_separator(model_name: str, device: str) -> Separator:
+    """同一模型與裝置只載入一次 Separator，後續分離直接重用。"""
+    return Separator(model=model_name, device=device, progress=True)
+
+
+def clear_separator_cache() -> None:
+    """釋放已快取的 Demucs Separator。"""
+    _prefetch_futures.clear()
+    _get_separator.cache_clear()
+
+
+def prefetch_demucs(model_name: str) -> None:
+    """
+    在背景執行緒預先載入指定模型的 Separator，讓使用者按下分離時模型已就緒。
+    """
+    if not model_name:
+        return
+    key = (model_name, _default_device())
+    if key not in _prefetch_futures:
+        _prefetch_futures[key] = _loader.submit(_get_separator, *key)
+
+
+def demix_audio(
+    audio_path: Union[str, os.PathLike],
+    model_name: str,
+    output_dir: Union[str, os.PathLike],
+    stems: Optional[Iterable[str]] = ("vocals",),
+    audio_format: str = "wav",
+):
     """
     使用指定的 demucs 模型分離音訊檔案，並將分離後的音軌儲存到指定目錄。
 
     Args:
-        audio_path (Path): 要處理的音訊檔案路徑。
+        audio_path (str | os.PathLike): 要處理的音訊檔案路徑。
         model_name (str): 要使用的 demucs 模型名稱。
-        output_dir (Path): 儲存分離音軌的目錄。
-    
+        output_dir (str | os.PathLike): 儲存分離音軌的目錄。
+        stems (Iterable[str] | None): 要儲存的音軌名稱，預設只存人聲；None 表示全部儲存。
+        audio_format (str): 儲存格式 ("wav", "flac", "mp3")，預設為編碼最快的 wav。
+
     Returns:
-        list[Path]: 分離後音軌檔案的路徑列表。
+        tuple[list[str], str | None]: 分離後音軌檔案的路徑列表，以及人聲音軌路徑。
     """
-    if not audio_path.is_file():
+    audio_path = os.fspath(audio_path)
+    output_dir = os.fspath(output_dir)
+    if not os.path.isfile(audio_path):
         print(f"錯誤：找不到指定的音訊檔案 -> {audio_path}")
-        return []
+        return [], None
 
     # 建立輸出目錄
-    output_dir.mkdir(parents=True, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
 
     print(f"正在初始化 Demucs Separator (模型: {model_name})...")
     try:
-        separator = Separator(
-            model=model_name,
-            device='cuda' if torch.cuda.is_available() else 'cpu',
-            progress=True
-        )
+        key = (model_name, _default_device())
+        pending = _prefetch_futures.pop(key, None)
+        if pending is not None:
+            # 等待背景載入完成；若失敗，下方會重新載入並回報錯誤
+            pending.exception()
+        separator = _get_separator(*key)
     except Exception as e:
         print(f"初始化 Separator 時發生錯誤: {e}")
         print("請確認您的環境已正確安裝 demucs 及其相依套件。")
-        return []
+        return [], None
 
     print(f"正在使用模型 '{separator._name}' 在裝置 '{separator._device}' 上進行分離...")
     print(f"音訊檔案: {audio_path}")
 
     try:
-        origin, separated = separator.separate_audio_file(audio_path)
+        fp16 = _use_fp16 and str(separator._device).startswith("cuda")
+        with torch.inference_mode(), torch.autocast(
+            "cuda", dtype=torch.float16, enabled=fp16
+        ):
+            origin, separated = separator.separate_audio_file(audio_path)
+        if fp16:
+            separated = {name: stem.float() for name, stem in separated.items()}
     except Exception as e:
         print(f"音訊分離過程中發生錯誤: {e}")
-        return []
+        return [], None
 
     print("音訊分離完成，正在儲存檔案...")
-    
-    output_paths = []
+
     vocal_only_audio_path = None
-    for stem_name, stem_tensor in separated.items():
-        output_filename = f"{audio_path.stem}_{stem_name}.mp3"
-        output_path = output_dir / output_filename
+    audio_stem = os.path.splitext(os.path.basename(audio_path))[0]
+    # 只編碼需要的音軌，省去其餘音軌的 MP3 編碼
+    wanted = None if stems is None else set(stems)
+    tasks = [
+        (stem_name, stem_tensor,
+         os.path.join(output_dir, f"{audio_stem}_{stem_name}.{audio_format}"))
+        for stem_name, stem_tensor in separated.items()
+        if wanted is None or stem_name in wanted
+    ]
 
+    def _save(task):
+        _, stem_tensor, output_path = task
         print(f"  - 正在儲存: {output_path}")
+        save_audio(stem_tensor, output_path, samplerate=separator.samplerate)
+        return output_path
 
-        save_audio(
-            stem_tensor,
-            str(output_path),
-            samplerate=separator.samplerate
-        )
-        output_paths.append(output_path)
+    if len(tasks) > 1:
+        # 編碼與寫檔會釋放 GIL，多個音軌（例如 stems=None）並行儲存
+        with ThreadPoolExecutor(max_workers=min(4, len(tasks))) as ex:
+            output_paths = list(ex.map(_save, tasks))
+    else:
+        output_paths = [_save(task) for task in tasks]
 
+    for (stem_name, _, _), output_path in zip(tasks, output_paths):
         if stem_name == "vocals":
-            vocal_only_audio_path = str(output_path)
+            vocal_only_audio_path = output_path
             print(f"  - 偵測到人聲音軌，已儲存為: {output_path}")
-        
+
     print("\n所有音軌已成功儲存！")
-    return output_paths, vocal_only_audio_path
\ No newline at end of file
+    return output_paths, vocal_only_audio_path
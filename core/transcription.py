@@ -1,12 +1,149 @@
+import gc
 import os
-import time
+import contextlib
+import sys
 import wave
-from typing import Tuple, Optional, List
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Tuple, Optional
+
+import numpy as np
 
 from backends import get_asr_backend
 from utils.subtitle_generator import save_transcription_results
 from utils.model import resolve_model_name
 
+# Futures of loaded backends keyed by (backend, model_name, language), least
+# recently used first. Kept small because every entry holds a full model in memory.
+_MAX_CACHED_BACKENDS = 2
+_backend_cache = OrderedDict()
+_backend_cache_lock = threading.Lock()
+# Only faster-whisper (CTranslate2) supports concurrent transcribe calls on one
+# model. The other backends keep per-call state on the shared model (e.g.
+# openai-whisper's KV-cache hooks), so their calls are serialized per instance.
+_THREAD_SAFE_BACKENDS = frozenset({"faster-whisper"})
+_UNLOCKED = contextlib.nullcontext()
+# Warmup targets already done (or in progress), so each one only runs once
+_warmed = set()
+_warmed_lock = threading.Lock()
+
+
+# Single background writer shared by all StreamingTranscriber instances, so
+# finalizing a segment doesn't block the streaming loop on disk I/O.
+_wav_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wav-writer")
+
+# Raised GC thresholds used while streaming, so automatic full collections
+# don't spike latency mid-stream. The previous thresholds are restored (and a
+# full collection run) once the last active stream closes.
+_STREAMING_GC_THRESHOLD = (7000, 100, 100)
+_gc_threshold_lock = threading.Lock()
+_gc_active_streams = 0
+_saved_gc_threshold = None
+
+
+def _raise_gc_threshold():
+    global _gc_active_streams, _saved_gc_threshold
+    with _gc_threshold_lock:
+        if _gc_active_streams == 0:
+            _saved_gc_threshold = gc.get_threshold()
+            gc.set_threshold(*(
+                max(c, s) for c, s in zip(_saved_gc_threshold, _STREAMING_GC_THRESHOLD)
+            ))
+        _gc_active_streams += 1
+
+
+def _restore_gc_threshold():
+    global _gc_active_streams
+    with _gc_threshold_lock:
+        _gc_active_streams -= 1
+        if _gc_active_streams == 0:
+            gc.set_threshold(*_saved_gc_threshold)
+
+
+def _save_wav(path, header, pcm_bytes, from_f32=False):
+    if from_f32:
+        # 段落 WAV 一律存成 16-bit PCM：標準 wave 模組可讀，檔案也只有 float32 的一半
+        samples = np.frombuffer(pcm_bytes, dtype=np.float32) * 32768.0
+        pcm_bytes = np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(pcm_bytes)
+
+
+def _release_gpu_memory():
+    """Return cached CUDA memory after a backend has been dropped."""
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _clear_faster_whisper_models():
+    """Drop faster-whisper's shared WhisperModel cache, if that backend is loaded."""
+    # 透過 sys.modules 取得，避免未使用 faster-whisper 時為了清快取而匯入它
+    fw = sys.modules.get("backends.asr.faster_whisper_backend")
+    if fw is not None:
+        fw.clear_model_cache()
+
+
+def _get_cached_backend(backend, model_name, language):
+    """
+    回傳已載入的 ASR 後端及其轉錄鎖 (asr, lock)，避免每次轉錄都重新載入模型。
+
+    快取中存的是 Future：模型在全域鎖之外載入，不同設定可同時載入，
+    相同設定的並行請求則等待同一個載入結果。同一個實例會被多個 Gradio worker
+    共用，呼叫 transcribe/to_asr_result 時須持有 lock。
+    """
+    key = (backend, model_name, language)
+    owner = False
+    evicted = False
+    with _backend_cache_lock:
+        future = _backend_cache.get(key)
+        if future is not None:
+            _backend_cache.move_to_end(key)
+        else:
+            future = Future()
+            _backend_cache[key] = future
+            owner = True
+            while len(_backend_cache) > _MAX_CACHED_BACKENDS:
+                _backend_cache.popitem(last=False)
+                evicted = True
+
+    if owner:
+        if evicted:
+            # 先釋放被淘汰的模型再載入新模型；faster-whisper 另有一層模型快取，
+            # 不清掉的話被淘汰的模型仍會留在記憶體中
+            _clear_faster_whisper_models()
+            _release_gpu_memory()
+        try:
+            kwargs = {"language": language}
+            if model_name:
+                kwargs["model_size"] = model_name
+            asr = get_asr_backend(backend, **kwargs)
+            lock = _UNLOCKED if backend in _THREAD_SAFE_BACKENDS else threading.Lock()
+            future.set_result((asr, lock))
+        except Exception as e:
+            with _backend_cache_lock:
+                if _backend_cache.get(key) is future:
+                    del _backend_cache[key]
+            future.set_exception(e)
+    return future.result()
+
+
+def clear_asr_cache():
+    """
+    清空已快取的 ASR 後端（含 faster-whisper 的模型快取）並釋放 GPU 記憶體。
+    """
+    with _backend_cache_lock:
+        _backend_cache.clear()
+    with _warmed_lock:
+        _warmed.clear()
+    _clear_faster_whisper_models()
+    _release_gpu_memory()
+
 
 def transcribe_audio(audio_input, backend, language, model_size, word_timestamps=True):
     """
@@ -19,18 +156,109 @@ def transcribe_audio(audio_input, backend, language, model_size, word_timestamps
         raise ValueError("無效的音訊輸入類型，預期為檔案路徑。")
 
     model_name = resolve_model_name(backend, model_size)
-    kwargs = {"language": language}
-    if model_name:
-        kwargs["model_size"] = model_name
-    asr = get_asr_backend(backend, **kwargs)
-    result = asr.transcribe(audio, word_timestamps=word_timestamps)
-
-    asr_result = asr.to_asr_result(result)
+    asr, lock = _get_cached_backend(backend, model_name, language)
+    with lock:
+        result = asr.transcribe(audio, word_timestamps=word_timestamps)
+        asr_result = asr.to_asr_result(result)
     subtitle_results = save_transcription_results(asr_result, audio)
 
     return asr_result.text, subtitle_results
 
 
+def transcribe_audio_batch(audio_paths, backend, language, model_size):
+    """
+    對多個音訊檔案進行離線轉錄，每個檔案各自輸出字幕檔。
+
+    後端支援批次推論時（faster-whisper 的 transcribe_batch）會將短音檔合併成批次處理；
+    其他後端則逐一轉錄。批次轉錄不產生逐字時間戳。
+
+    Returns:
+        list[tuple[str, list]]: 依 audio_paths 順序排列的 (文字, 字幕檔路徑列表)。
+    """
+    audio_paths = list(audio_paths)
+    model_name = resolve_model_name(backend, model_size)
+    asr, lock = _get_cached_backend(backend, model_name, language)
+
+    transcribe_batch = getattr(asr, "transcribe_batch", None)
+    with lock:
+        if transcribe_batch is not None:
+            asr_results = transcribe_batch(audio_paths)
+        else:
+            asr_results = [
+                asr.to_asr_result(asr.transcribe(path, word_timestamps=False))
+                for path in audio_paths
+            ]
+
+    return [
+        (asr_result.text, save_transcription_results(asr_result, path))
+        for asr_result, path in zip(asr_results, audio_paths)
+    ]
+
+
+def _try_mark_warmed(key) -> bool:
+    """登記一個預熱目標；已預熱（或正在預熱）時回傳 False。"""
+    with _warmed_lock:
+        if key in _warmed:
+            return False
+        _warmed.add(key)
+        return True
+
+
+def warmup_backend(backend, model_size, language="auto"):
+    """
+    對一秒的靜音執行一次轉錄，預先載入模型並觸發 CUDA/MLX 的初始化與 kernel 編譯。
+
+    同一組 (backend, model, language) 只會預熱一次。faster-whisper 的 VAD 會把靜音
+    整段濾掉而不執行模型，因此預熱時關閉 VAD。
+    """
+    model_name = resolve_model_name(backend, model_size)
+    key = (backend, model_name, language)
+    if not _try_mark_warmed(key):
+        return
+
+    warmup_path = os.path.join(tempfile.gettempdir(), "multi_asr_warmup.wav")
+    if not os.path.exists(warmup_path):
+        with wave.open(warmup_path, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(b"\x00\x00" * 16000)
+
+    try:
+        asr, lock = _get_cached_backend(backend, model_name, language)
+        kwargs = {"word_timestamps": False}
+        if getattr(asr, "vad_filter", False):
+            kwargs["vad_filter"] = False
+        with lock:
+            asr.to_asr_result(asr.transcribe(warmup_path, **kwargs))
+    except Exception as e:
+        print(f"[WARN] {backend} 模型預熱失敗: {e}")
+        with _warmed_lock:
+            _warmed.discard(key)
+
+
+def warmup_streaming_backend(backend="sherpa-onnx", sample_rate=16000):
+    """
+    建立一次串流引擎並餵入一秒靜音，讓模型檔進入系統快取並完成 ONNX Runtime 的初始化。
+    """
+    key = (backend, None, None)
+    if not _try_mark_warmed(key):
+        return
+    try:
+        asr = get_asr_backend(backend)
+        asr.accept_pcm16_bytes(b"\x00\x00" * sample_rate, sample_rate=sample_rate)
+        asr.decode()
+    except Exception as e:
+        print(f"[WARN] {backend} 模型預熱失敗: {e}")
+        with _warmed_lock:
+            _warmed.discard(key)
+
+
+def start_warmup(target, *args):
+    """在背景 daemon 執行緒執行預熱，不阻塞 UI 建立與啟動。"""
+    threading.Thread(target=target, args=args, daemon=True).start()
+
+
 class StreamingTranscriber:
     """
     一個處理音訊流的控制器。
@@ -46,6 +274,7 @@ class StreamingTranscriber:
     5. 當一個句子結束時，將該句對應的音訊儲存為 WAV 檔案。
     """
     puncts = {".", "?", "!", "。", "？", "！", ",", "，", ";", "；"}
+    _punct_set = frozenset(puncts)
     FinalizedSegment = Optional[Tuple[float, float, str, str]]
 
     def __init__(
@@ -58,6 +287,8 @@ class StreamingTranscriber:
         stall_ms: int = 900,
         partial_min_interval: float = 0.25,
         min_utt_sec: float = 2.0,
+        sample_format: str = "s16le",
+        max_buffer_sec: Optional[float] = None,
     ):
         """
         初始化 StreamingTranscriber。
@@ -71,28 +302,58 @@ class StreamingTranscriber:
             stall_ms (int): 當辨識結果停滯超過此毫秒數時，視為句子結束並切分。
             partial_min_interval (float): 初步辨識結果的最小更新間隔（秒），用於UI節流。
             min_utt_sec (float): 觸發停頓切分的最小句子長度（秒）。
+            sample_format (str): 輸入 PCM 格式，"s16le" 或 "f32le"（ffmpeg 直接輸出 float32，
+                餵給引擎時不需再做 int16→float32 轉換）。
+            max_buffer_sec (float | None): 段落音訊緩衝區最多保留的秒數，超過時只保留最近的部分，
+                避免段落遲遲未切分時緩衝區無限成長；None 表示不限制。
         """
+        if sample_format not in ("s16le", "f32le"):
+            raise ValueError(f"Unsupported sample format: {sample_format}")
+        self.sample_format = sample_format
         self.streaming_asr = streaming_asr
+        # 提高 GC 門檻，避免串流途中觸發完整回收造成延遲尖峰；close() 時還原
+        _raise_gc_threshold()
+        self._gc_raised = True
+        # 取樣率在建構時就確定，相符時直接綁定引擎免檢查的餵入方法，省去每個 chunk 的判斷
+        if sample_format == "f32le":
+            self._feed_asr_engine = self._feed_asr_engine_f32
+        else:
+            fast_accept = getattr(streaming_asr, "accept_pcm16_bytes_fast", None)
+            if fast_accept is not None and getattr(streaming_asr, "expected_sr", None) == sample_rate:
+                self._feed_asr_engine = fast_accept
 
         # Audio parameters
         self.sample_rate = sample_rate
-        self.bytes_per_sample = 2  # s16le
+        self.bytes_per_sample = 4 if sample_format == "f32le" else 2
         self.chunk_bytes = int(self.sample_rate * self.bytes_per_sample * chunk_sec)
         self.overlap_bytes = int(self.sample_rate * self.bytes_per_sample * overlap_sec)
+        # Keep chunk boundaries on whole samples
+        self.chunk_bytes -= self.chunk_bytes % self.bytes_per_sample
+        self.overlap_bytes -= self.overlap_bytes % self.bytes_per_sample
         self.step_time_sec = (self.chunk_bytes - self.overlap_bytes) / (self.sample_rate * self.bytes_per_sample)
-        self._ring: bytes = b""
+        self.step_frames = (self.chunk_bytes - self.overlap_bytes) // self.bytes_per_sample
+        # Unconsumed tail of the input stream; appended and trimmed in place
+        self._ring = bytearray()
+        self.max_buffer_bytes = None
+        if max_buffer_sec is not None:
+            self.max_buffer_bytes = int(self.sample_rate * max_buffer_sec) * self.bytes_per_sample
 
         # Segmentation control parameters
         self.max_utt_sec = max_utt_sec
         self.stall_ms = stall_ms
         self.partial_min_interval = partial_min_interval
         self.min_utt_sec = min_utt_sec
+        # 停頓與 UI 節流都以已處理的取樣數計時，不必在熱路徑上讀取系統時鐘
+        self._stall_frames = self.sample_rate * self.stall_ms / 1000.0
+        self._partial_min_frames = self.sample_rate * self.partial_min_interval
 
         # State variables
         self._last_partial = ""
-        self._last_change_t = time.monotonic()
-        self._last_emit_t = 0.0
-        self._seg_bytes: List[bytes] = []
+        self._total_frames = 0
+        self._last_change_frames = 0
+        self._last_emit_frames = -self._partial_min_frames
+        self._last_decode_time = 0.0
+        self._seg_buf = bytearray()
         self._seg_start_time = 0.0
         self.estimated_end_time = 0.0
 
@@ -100,29 +361,57 @@ class StreamingTranscriber:
         self.out_dir = "audios"
         self.filename_prefix = "seg"
         self._seg_index = 1
+        self._pending_writes = []
+        # 44-byte mono 16-bit PCM WAV header (f32le input is converted when
+        # written); only the RIFF and data sizes (offsets 4 and 40) change
+        # per segment.
+        self._wav_header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 0, b"WAVE", b"fmt ", 16, 1, 1,
+            self.sample_rate, self.sample_rate * 2, 2, 16, b"data", 0,
+        )
         if self.out_dir:
             os.makedirs(self.out_dir, exist_ok=True)
 
-    def _feed_asr_engine(self, raw_bytes: bytes):
-        """將 PCM 音訊數據餵給底層的 ASR 引擎。"""
+    def _feed_asr_engine(self, raw_bytes):
+        """將 PCM 音訊數據（可為 ring buffer 的 memoryview 切片）餵給底層的 ASR 引擎。"""
         self.streaming_asr.accept_pcm16_bytes(raw_bytes, sample_rate=self.sample_rate)
 
-    def _concat_seg_pcm(self) -> bytes:
-        """將當前段落累積的 PCM bytes 串接起來。"""
-        return b"".join(self._seg_bytes) if self._seg_bytes else b""
+    def _feed_asr_engine_f32(self, raw_bytes):
+        """將 f32le 音訊數據直接以 float32 view 餵給 ASR 引擎，不做任何轉換。"""
+        self.streaming_asr.accept_waveform_float32(
+            np.frombuffer(raw_bytes, dtype=np.float32), sample_rate=self.sample_rate
+        )
+
+    def _concat_seg_pcm(self) -> bytearray:
+        """回傳當前段落累積的 PCM 緩衝區。"""
+        return self._seg_buf
+
+    def _write_wav(self, pcm_bytes) -> str:
+        """
+        在背景執行緒將 PCM bytes 寫入 WAV 檔案，並立即回傳路徑。
 
-    def _write_wav(self, pcm_bytes: bytes) -> str:
-        """將 PCM bytes 寫入 WAV 檔案並回傳路徑。"""
+        pcm_bytes 交出後不可再修改；需要讀取檔案前請先呼叫 wait_for_writes()。
+        """
         fname = f"{self.filename_prefix}_{self._seg_index:04d}.wav"
         path = os.path.join(self.out_dir, fname)
-        with wave.open(path, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(self.bytes_per_sample)
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(pcm_bytes)
+        data_size = len(pcm_bytes) // self.bytes_per_sample * 2
+        header = bytearray(self._wav_header)
+        struct.pack_into("<I", header, 4, 36 + data_size)
+        struct.pack_into("<I", header, 40, data_size)
+        self._pending_writes = [f for f in self._pending_writes if not f.done()]
+        self._pending_writes.append(_wav_writer.submit(
+            _save_wav, path, header, pcm_bytes, self.sample_format == "f32le"
+        ))
         self._seg_index += 1
         return path
 
+    def wait_for_writes(self) -> None:
+        """等待所有已提交的 WAV 檔案寫入完成。"""
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.result()
+
     def _finalize_segment(self, text: str) -> FinalizedSegment:
         """
         結束目前音訊段落的處理。
@@ -142,29 +431,41 @@ class StreamingTranscriber:
 
         # Reset for the next segment
         self._seg_start_time = seg_end
-        self._seg_bytes = []
+        self._seg_buf = bytearray()
         self.streaming_asr.reset()
-        now = time.monotonic()
         self._last_partial = ""
-        self._last_change_t = now
-        self._last_emit_t = now
+        self._last_change_frames = self._total_frames
+        self._last_emit_frames = self._total_frames
 
         return (seg_start, seg_end, text, audio_path)
 
     def flush(self) -> FinalizedSegment:
         """
-        處理剩餘的音訊緩衝區，強制結束當前的段落。
+        處理剩餘的音訊緩衝區，強制結束當前的段落，並呼叫 close()。
         """
-        if not self._seg_bytes:
-            return None
-
-        final_text = ""
-        if self._ring:
-            self._feed_asr_engine(self._ring)
-            final_text = self.streaming_asr.decode().strip()
-            self._ring = b""
+        finalized_segment = None
+        if self._seg_buf:
+            final_text = ""
+            if self._ring:
+                self._feed_asr_engine(self._ring)
+                final_text = self.streaming_asr.decode().strip()
+                self._ring.clear()
+            finalized_segment = self._finalize_segment(final_text)
+
+        self.close()
+        return finalized_segment
+
+    def close(self) -> None:
+        """
+        結束串流：等待 WAV 寫入完成、還原 GC 門檻並執行一次完整回收。
 
-        return self._finalize_segment(final_text)
+        可重複呼叫；串流中途被中斷時（例如 generator 被關閉）也應呼叫。
+        """
+        self.wait_for_writes()
+        if self._gc_raised:
+            self._gc_raised = False
+            _restore_gc_threshold()
+            gc.collect()
 
     def stream_transcribe(
         self, audio_bytes: bytes
@@ -173,7 +474,7 @@ class StreamingTranscriber:
         處理傳入的音訊流塊。
 
         Args:
-            audio_bytes: s16le 格式的 PCM 音訊數據。
+            audio_bytes: sample_format 格式（s16le 或 f32le）的 PCM 音訊數據。
 
         Returns:
             一個元組 (partial_result, finalized_segment)。
@@ -183,35 +484,59 @@ class StreamingTranscriber:
         if not audio_bytes:
             return None, self.flush()
 
-        self._seg_bytes.append(audio_bytes)
-        buf = self._ring + audio_bytes
+        self._seg_buf += audio_bytes
+        if self.max_buffer_bytes is not None and len(self._seg_buf) > self.max_buffer_bytes:
+            # 只保留最近 max_buffer_sec 的段落音訊，段落起點隨之後移，讓 WAV 與回報的時間一致
+            trimmed = len(self._seg_buf) - self.max_buffer_bytes
+            del self._seg_buf[:trimmed]
+            self._seg_start_time += trimmed / (self.sample_rate * self.bytes_per_sample)
+        self._ring += audio_bytes
+        # Slices of the memoryview are zero-copy; it must be released before
+        # the ring buffer is trimmed.
+        buf = memoryview(self._ring)
         buffer_position = 0
         step_size = max(1, self.chunk_bytes - self.overlap_bytes)
         emitted_partial: Optional[str] = None
 
         while buffer_position + self.chunk_bytes <= len(buf):
             # 1. 提取 chunk 並餵給 ASR 引擎
-            piece = buf[buffer_position:buffer_position + self.chunk_bytes]
-            self._feed_asr_engine(piece)
+            self._feed_asr_engine(buf[buffer_position:buffer_position + self.chunk_bytes])
 
             # 2. 更新估算的時間
             # 我們的處理進度向前推進了一個步長的時間
             self.estimated_end_time += self.step_time_sec
+            self._total_frames += self.step_frames
 
             # 3. 獲取並處理初步辨識結果
-            now = time.monotonic()
-            partial = self.streaming_asr.decode()
-            stripped = partial.strip()
+            # 解碼節流：只有在引擎有新 frame 可解，且音訊已前進超過
+            # partial_min_interval 或偵測到端點時才解碼，否則沿用上次結果。
+            # 以音訊時間而非牆鐘時間計算，離線快速處理時切段行為才會一致。
+            # decode_if_ready() 在沒有任何解碼步驟時回傳 None，此時結果不變。
+            partial = None
+            if (
+                (self.estimated_end_time - self._last_decode_time)
+                >= self.partial_min_interval
+                or self.streaming_asr.is_endpoint()
+            ):
+                partial = self.streaming_asr.decode_if_ready()
+            decoded = partial is not None
+            if decoded:
+                self._last_decode_time = self.estimated_end_time
+            else:
+                partial = self._last_partial
 
             # --- 初步結果更新邏輯 (UI 優化) ---
             if partial != self._last_partial:
                 self._last_partial = partial
-                self._last_change_t = now  # 記錄結果變化的時間點，用於後續偵測停頓
+                self._last_change_frames = self._total_frames  # 記錄結果變化的位置，用於後續偵測停頓
 
                 # 更新節流：避免過於頻繁地更新畫面導致閃爍
-                if stripped and (now - self._last_emit_t) >= self.partial_min_interval:
+                if (
+                    (self._total_frames - self._last_emit_frames) >= self._partial_min_frames
+                    and partial and not partial.isspace()
+                ):
                     emitted_partial = partial
-                    self._last_emit_t = now
+                    self._last_emit_frames = self._total_frames
 
             # 4. 判斷是否需要切分段落
             # 計算目前段落的持續時間
@@ -219,20 +544,31 @@ class StreamingTranscriber:
 
             # 定義分段條件
             too_long = current_utt_duration >= self.max_utt_sec
-            stalled = (now - self._last_change_t) * 1000.0 >= self.stall_ms
+            # 停頓只在本步有實際解碼時判斷：節流跳過解碼的步驟沿用舊結果，
+            # 文字看似沒變不代表使用者停頓
+            stalled = decoded and (self._total_frames - self._last_change_frames) >= self._stall_frames
             stalled_trigger = stalled and (current_utt_duration >= self.min_utt_sec)
-            punct_trigger = any(p in stripped for p in self.puncts)
+            # 標點幾乎都出現在句尾，只檢查最後一個非空白字元，不必掃描整句
+            tail = partial[-4:].rstrip()
+            punct_trigger = bool(tail) and tail[-1] in self._punct_set
 
             # 如果滿足任一分段條件，則結束目前段落
             if too_long or stalled_trigger or (punct_trigger and current_utt_duration > 1.0):
-                finalized_segment = self._finalize_segment(stripped)
-
-                # 將本次處理後剩餘的音訊存入 ring 緩衝區，供下次使用
-                self._ring = buf[buffer_position + step_size:]
+                if not decoded:
+                    # 切段前先解完剩餘的 frame，避免 reset 時遺失文字
+                    text = self.streaming_asr.decode_if_ready()
+                    if text is not None:
+                        partial = text
+                finalized_segment = self._finalize_segment(partial.strip())
+
+                # 將本次處理後剩餘的音訊留在 ring 緩衝區，供下次使用
+                buf.release()
+                del self._ring[:buffer_position + step_size]
                 return emitted_partial, finalized_segment
 
             # 5. 向前滑動視窗
             buffer_position += step_size
 
-        self._ring = buf[buffer_position:]
+        buf.release()
+        del self._ring[:buffer_position]
         return emitted_partial, None
\ No newline at end of file
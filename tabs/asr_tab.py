@@ -1,10 +1,11 @@
 from dataclasses import dataclass
-from pathlib import Path
 
 import gradio as gr
 
-from core.demucs import demix_audio
-from core.transcription import transcribe_audio
+from core.demucs import clear_separator_cache, demix_audio, prefetch_demucs
+from core.transcription import (
+    clear_asr_cache, start_warmup, transcribe_audio, warmup_backend,
+)
 from utils.preprocess import get_media_path
 
 refresh_symbol = '🔄'
@@ -19,25 +20,28 @@ class TranscriptionOptions:
     word_timestamps: bool
 
 
-def run_demixing(audio_path, model_name):
+def refresh_models():
+    """Drops cached ASR backends and Demucs separators so the next run reloads them."""
+    clear_separator_cache()
+    clear_asr_cache()  # also releases cached GPU memory
+
+
+def run_demixing(audio_path, model_name, audio_format="wav"):
     if not audio_path:
         return (None, None, gr.Textbox("錯誤：音訊檔案路徑為空", visible=True))
 
-    audio_path = Path(audio_path)
-    output_dir = Path("demix_output")
+    output_dir = "demix_output"
 
-    separated_files, vocal_audio_path = demix_audio(
-        audio_path, model_name, output_dir
+    # demix_audio returns plain string paths, which Gradio accepts directly
+    file_paths, vocal_audio_path = demix_audio(
+        audio_path, model_name, output_dir, audio_format=audio_format
     )
 
-    # Convert Path objects to strings for Gradio
-    file_paths = [str(p) for p in separated_files]
-
     # If no vocal track is found, return an error message
     if vocal_audio_path is None:
         return (
             file_paths,
-            str(audio_path),
+            audio_path,
             gr.Textbox("警告：未找到人聲音軌，請檢查音訊檔案。", visible=True)
         )
 
@@ -111,6 +115,13 @@ def create_asr_tab(
         "update_backend_options": update_backend_options,
     }
 
+    # Default to the CTranslate2 (int8 on CPU) engine, the fastest of the
+    # offline backends, when it is offered.
+    default_backend = (
+        "faster-whisper" if "faster-whisper" in options["asr_backend_choices"]
+        else options["asr_backend_choices"][0]
+    )
+
     # Dictionary to hold all Gradio components
     c = {}
 
@@ -129,7 +140,7 @@ def create_asr_tab(
                     label="YouTube Video Quality", interactive=True
                 )
                 c["audio_format"] = gr.Radio(
-                    choices=["wav", "flac", "mp3"], value="mp3",
+                    choices=["wav", "flac", "mp3"], value="wav",
                     label="Audio Format", interactive=True
                 )
                 c["submit_btn"] = gr.Button("上傳")
@@ -150,7 +161,7 @@ def create_asr_tab(
                     label="MDX Models", interactive=True
                 )
                 c["demix_audio_format"] = gr.Radio(
-                    choices=["wav", "flac", "mp3"], value="mp3",
+                    choices=["wav", "flac", "mp3"], value="wav",
                     label="Audio Format", interactive=True
                 )
                 c["demix_results"] = gr.File(
@@ -166,18 +177,19 @@ def create_asr_tab(
                 # ASR section
                 c["asr_backend_dropdown"] = gr.Dropdown(
                     choices=options["asr_backend_choices"], label="選擇引擎",
-                    value=options["asr_backend_choices"][0]
+                    value=default_backend
                 )
                 c["language_dropdown"] = gr.Dropdown(
                     choices=options["language_choices"], label="語言",
                     value=options["language_choices"][0]
                 )
                 c["modelsize_dropdown"] = gr.Dropdown(
-                    choices=options["model_size_options"]["transformers"],
+                    choices=list(options["model_size_options"][default_backend]),
                     label="模型大小", value="small"
                 )
                 c["word_timestamps_check"] = gr.Checkbox(
-                    label="Word Timestamps - Highlight Words", value=True,
+                    label="Word Timestamps - Highlight Words (slower)",
+                    value=False,
                     interactive=True
                 )
                 c["subtitle_results"] = gr.File(
@@ -195,9 +207,25 @@ def create_asr_tab(
         outputs=[c["video_preview"], c["audio_preview"], c["error_box"]],
     )
 
+    c["refresh_btn"].click(  # pylint: disable=no-member
+        fn=refresh_models, inputs=None, outputs=None
+    )
+
+    # Start loading the selected demixing model as soon as media arrives, so
+    # it is ready by the time Demixing is clicked.
+    c["file_input"].upload(  # pylint: disable=no-member
+        fn=prefetch_demucs, inputs=c["demix_mode_dropdown"], outputs=None
+    )
+    c["submit_btn"].click(  # pylint: disable=no-member
+        fn=prefetch_demucs, inputs=c["demix_mode_dropdown"], outputs=None
+    )
+
     c["demix_btn"].click(  # pylint: disable=no-member
         fn=run_demixing,
-        inputs=[c["audio_preview"], c["demix_mode_dropdown"]],
+        inputs=[
+            c["audio_preview"], c["demix_mode_dropdown"],
+            c["demix_audio_format"],
+        ],
         outputs=[
             c["demix_results"], c["audio_preview"], c["error_box"],
         ],
@@ -209,6 +237,15 @@ def create_asr_tab(
         outputs=[c["modelsize_dropdown"], c["language_dropdown"]]
     )
 
+    # Warm up the dropdown defaults (backend, model size and language) in the
+    # background so the first transcription doesn't pay for model loading.
+    # This is the only ASR warmup; other selections load on first use.
+    start_warmup(
+        warmup_backend,
+        c["asr_backend_dropdown"].value, c["modelsize_dropdown"].value,
+        c["language_dropdown"].value,
+    )
+
     c["transcribe_btn"].click(  # pylint: disable=no-member
         fn=create_transcription_options_and_transcribe,
         inputs=[
@@ -5,7 +5,7 @@ import gradio as gr
 
 from utils.preprocess import extract_audio_chunks_from_video
 from backends import get_asr_backend
-from core.transcription import StreamingTranscriber
+from core.transcription import StreamingTranscriber, start_warmup, warmup_streaming_backend
 
 
 def load_audio(selected_row):
@@ -36,36 +36,48 @@ def ui_stream_process(
         stall_ms=int(stall_ms),
         min_utt_sec=float(min_utt_sec),
         partial_min_interval=float(partial_min_interval),
+        sample_format="f32le",
+        # 正常情況下段落在 max_utt_sec 就會切分；上限多留兩個 chunk 的餘裕，只作為保險
+        max_buffer_sec=float(max_utt_sec) + 2 * float(chunk_sec),
     )
 
     samples: List[List[Union[int, float, str]]] = []
     idx = 1
     latest_audio = None
 
-    # 初次回傳空資料集，避免 UI 還沒資料時報型別
-    yield "", gr.Dataset(samples=[]), None
+    try:
+        # 初次回傳空資料集，避免 UI 還沒資料時報型別
+        yield "", gr.Dataset(samples=[]), None
 
-    for pcm in extract_audio_chunks_from_video(video, chunk_sec=float(chunk_sec)):
-        partial, finalized_segment = transcriber.stream_transcribe(pcm)
+        for pcm in extract_audio_chunks_from_video(
+            video, chunk_sec=float(chunk_sec), legacy_s16=False
+        ):
+            partial, finalized_segment = transcriber.stream_transcribe(pcm)
  
-        # 即時更新初步辨識結果
-        if partial:
-            yield partial, None, latest_audio
-
-        # 當一個段落結束時，更新 Dataset
-        if finalized_segment:
-            t0, t1, text, audio_path = finalized_segment
-            row = [
-                idx,
-                f"{t0:.2f}",
-                f"{t1:.2f}",
-                text,
-                audio_path,
-            ]
-            samples.append(row)
-            idx += 1
-            latest_audio = audio_path
-            yield partial or "", gr.update(samples=samples), latest_audio
+            # 即時更新初步辨識結果
+            if partial:
+                yield partial, None, latest_audio
+
+            # 當一個段落結束時，更新 Dataset
+            if finalized_segment:
+                # The segment WAV is written in the background; make sure it is
+                # on disk before Gradio serves it.
+                transcriber.wait_for_writes()
+                t0, t1, text, audio_path = finalized_segment
+                row = [
+                    idx,
+                    f"{t0:.2f}",
+                    f"{t1:.2f}",
+                    text,
+                    audio_path,
+                ]
+                samples.append(row)
+                idx += 1
+                latest_audio = audio_path
+                yield partial or "", gr.update(samples=samples), latest_audio
+    finally:
+        # 還原串流期間調高的 GC 門檻（使用者中途停止時也會執行）
+        transcriber.close()
 
 
 def create_split_audio_tab():
@@ -121,4 +133,7 @@ def create_split_audio_tab():
             fn=load_audio,
             inputs=[segments],
             outputs=[partial, player]
-        )
\ No newline at end of file
+        )
+
+    # Load the streaming engine once in the background before the first click
+    start_warmup(warmup_streaming_backend)
\ No newline at end of file
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+try:
+    from utils.preprocess import _read_whole_samples
+except ImportError as e:  # yt_dlp is imported at module level
+    _read_whole_samples = None
+    _import_error = e
+
+
+class _OddReader:
+    """Hands out a byte stream in fixed, sample-misaligned read sizes, like a non-blocking pipe."""
+
+    def __init__(self, data, sizes):
+        self.data = data
+        self.pos = 0
+        self.sizes = sizes
+        self.calls = 0
+
+    def __call__(self, view):
+        size = self.sizes[self.calls % len(self.sizes)]
+        self.calls += 1
+        if size is None:
+            return None
+        n = min(size, len(view), len(self.data) - self.pos)
+        view[:n] = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+
+@unittest.skipIf(_read_whole_samples is None, "utils.preprocess dependencies not installed")
+class ReadWholeSamplesTest(unittest.TestCase):
+    def _collect(self, data, sizes, frame_bytes=64, bytes_per_sample=4):
+        chunks = []
+        for chunk in _read_whole_samples(_OddReader(data, sizes), frame_bytes, bytes_per_sample):
+            self.assertEqual(len(chunk) % bytes_per_sample, 0)
+            chunks.append(bytes(chunk))  # the view is only valid until the next read
+        return b"".join(chunks)
+
+    def test_odd_length_reads_yield_whole_f32_samples(self):
+        samples = np.arange(100, dtype=np.float32)
+        out = self._collect(samples.tobytes(), [3, 5, None, 1, 7, 2, 64])
+        np.testing.assert_array_equal(np.frombuffer(out, dtype=np.float32), samples)
+
+    def test_trailing_partial_sample_is_dropped(self):
+        samples = np.arange(10, dtype=np.float32)
+        out = self._collect(samples.tobytes() + b"\x01\x02", [5, 3])
+        np.testing.assert_array_equal(np.frombuffer(out, dtype=np.float32), samples)
+
+    def test_s16_reads(self):
+        samples = np.arange(-50, 50, dtype="<i2")
+        out = self._collect(samples.tobytes(), [1, 3, 9], frame_bytes=32, bytes_per_sample=2)
+        np.testing.assert_array_equal(np.frombuffer(out, dtype="<i2"), samples)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from utils import subtitle_generator
+from utils.dataclasses import ASRResult, ASRSegment, ASRToken
+
+
+class DumpsNumpyTest(unittest.TestCase):
+    """faster-whisper and whisper hand back numpy scalars for word timings."""
+
+    values = {
+        "start": np.float64(1.25),
+        "end": np.float32(2.5),
+        "probability": np.float64(0.875),
+        "tokens": [{"start": np.float64(0.5)}],
+    }
+    expected = {
+        "start": 1.25,
+        "end": 2.5,
+        "probability": 0.875,
+        "tokens": [{"start": 0.5}],
+    }
+
+    @unittest.skipIf(subtitle_generator.orjson is None, "orjson not installed")
+    def test_orjson_serializes_numpy_scalars(self):
+        out = subtitle_generator._dumps(self.values)
+        self.assertEqual(json.loads(out), self.expected)
+
+    def test_stdlib_fallback_serializes_numpy_scalars(self):
+        with mock.patch.object(subtitle_generator, "orjson", None):
+            out = subtitle_generator._dumps(self.values)
+        self.assertEqual(json.loads(out), self.expected)
+
+    def test_unsupported_type_still_raises(self):
+        with mock.patch.object(subtitle_generator, "orjson", None):
+            with self.assertRaises(TypeError):
+                subtitle_generator._dumps({"x": object()})
+
+
+def _numpy_result():
+    # Same shapes as FasterWhisperBackend.to_asr_result with word timestamps
+    tokens = [
+        ASRToken(np.float64(0.1), np.float64(0.5), " hi", np.float64(0.93)),
+        ASRToken(np.float64(0.5), np.float64(1.2), " there", np.float64(0.81)),
+    ]
+    return ASRResult(
+        text="hi there",
+        segments=[
+            ASRSegment(np.float64(0.1), np.float64(1.2), " hi there", tokens=tokens),
+            ASRSegment(np.float64(1.5), np.float64(2.25), " bye"),
+        ],
+        language="en",
+    )
+
+
+_EXPECTED_SEGMENTS = [
+    {
+        "start": 0.1, "end": 1.2, "text": " hi there", "speaker": None,
+        "tokens": [
+            {"start": 0.1, "end": 0.5, "token": " hi", "probability": 0.93},
+            {"start": 0.5, "end": 1.2, "token": " there", "probability": 0.81},
+        ],
+    },
+    {"start": 1.5, "end": 2.25, "text": " bye", "speaker": None, "tokens": []},
+]
+
+
+class JsonStreamWriterNumpyTest(unittest.TestCase):
+    """The streaming JSON writer dumps every segment with numpy-typed values."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.audio_path = os.path.join(self._tmp.name, "a.wav")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _check(self, json_path):
+        with open(json_path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["text"], "hi there")
+        self.assertEqual(data["language"], "en")
+        self.assertEqual(data["segments"], _EXPECTED_SEGMENTS)
+
+    def test_save_as_json(self):
+        self._check(subtitle_generator.save_as_json(_numpy_result(), self.audio_path))
+
+    def test_save_transcription_results(self):
+        paths = subtitle_generator.save_transcription_results(
+            _numpy_result(), self.audio_path
+        )
+        self._check(paths[3])
+        with open(paths[0], encoding="utf-8") as f:
+            self.assertTrue(f.read().startswith("1\n00:00:00,100 --> 00:00:01,200\n"))
+
+    def test_stdlib_fallback(self):
+        with mock.patch.object(subtitle_generator, "orjson", None):
+            self._check(
+                subtitle_generator.save_as_json(_numpy_result(), self.audio_path)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from core import transcription
+
+
+class _FakeBackend:
+    """Records how many transcribe calls overlap on one instance."""
+
+    def __init__(self, **kwargs):
+        self.active = 0
+        self.max_active = 0
+        self._count_lock = threading.Lock()
+
+    def transcribe(self, audio_path, word_timestamps=True):
+        with self._count_lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._count_lock:
+            self.active -= 1
+        return audio_path
+
+    def to_asr_result(self, result):
+        return result
+
+
+class CachedBackendLockTest(unittest.TestCase):
+    def setUp(self):
+        transcription.clear_asr_cache()
+        patcher = mock.patch.object(transcription, "get_asr_backend",
+                                    side_effect=lambda backend, **kw: _FakeBackend())
+        self.get_asr_backend = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(transcription.clear_asr_cache)
+
+    def _run_concurrently(self, backend, n=4):
+        def job():
+            asr, lock = transcription._get_cached_backend(backend, "small", "en")
+            with lock:
+                asr.to_asr_result(asr.transcribe("a.wav"))
+
+        threads = [threading.Thread(target=job) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        asr, _ = transcription._get_cached_backend(backend, "small", "en")
+        return asr
+
+    def test_shared_instance_is_loaded_once(self):
+        self._run_concurrently("whisper")
+        self.assertEqual(self.get_asr_backend.call_count, 1)
+
+    def test_non_thread_safe_backend_is_serialized(self):
+        asr = self._run_concurrently("whisper")
+        self.assertEqual(asr.max_active, 1)
+
+    def test_faster_whisper_runs_concurrently(self):
+        asr = self._run_concurrently("faster-whisper")
+        self.assertGreater(asr.max_active, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Convert the sherpa-onnx models to ONNX Runtime's ORT format.
+
+The ORT format stores an already-optimized graph, so creating the
+InferenceSession skips node fusion / constant folding at startup. The
+converted `<name>.ort` files are written next to the `.onnx` files and are
+picked up automatically by `get_asr_backend("sherpa-onnx")`.
+
+Usage:
+    python tools/convert_to_ort.py [models_dir]
+"""
+import os
+import sys
+import argparse
+import subprocess
+
+default_models_dir = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "models", "korean_zipformer",
+)
+
+
+def convert_to_ort(models_dir: str) -> int:
+    cmd = [
+        sys.executable, "-m",
+        "onnxruntime.tools.convert_onnx_models_to_ort",
+        models_dir,
+        "--optimization_style", "Fixed",
+    ]
+    print(f"[INFO] {' '.join(cmd)}")
+    return subprocess.call(cmd)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert sherpa-onnx .onnx models to the .ort format"
+    )
+    parser.add_argument(
+        "models_dir", nargs="?", default=default_models_dir,
+        help="包含 .onnx 模型的目錄，預設為 models/korean_zipformer"
+    )
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.models_dir):
+        print(f"錯誤：找不到模型目錄 -> {args.models_dir}")
+        sys.exit(1)
+    sys.exit(convert_to_ort(args.models_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class ASRToken:
     """Represents a single token from an ASR model."""
     start: float
@@ -11,7 +13,7 @@ class ASRToken:
     probability: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ASRSegment:
     """Represents a segment of transcribed audio."""
     start: float
@@ -21,9 +23,72 @@ class ASRSegment:
     tokens: List[ASRToken] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class ASRResultArrays:
+    """
+    Word-level tokens of a whole transcript stored column-wise.
+
+    Row i is one token; seg_ids[i] is the index of the segment it belongs to
+    and is non-decreasing. Timestamps stay float64 so values round-trip to
+    JSON unchanged.
+    """
+    texts: np.ndarray     # object (str)
+    starts: np.ndarray    # float64
+    ends: np.ndarray      # float64
+    probs: np.ndarray     # float64
+    seg_ids: np.ndarray   # int32
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[dict]) -> "ASRResultArrays":
+        """Builds the columns from whisper-style segment dicts with a "words" list."""
+        rows = [
+            (seg_id, word)
+            for seg_id, seg in enumerate(segments)
+            for word in seg.get("words", ())
+            if word.get("start") is not None
+        ]
+        n = len(rows)
+        return cls(
+            texts=np.array([w.get("word") for _, w in rows], dtype=object),
+            starts=np.fromiter((w["start"] for _, w in rows), dtype=np.float64, count=n),
+            ends=np.fromiter((w["end"] for _, w in rows), dtype=np.float64, count=n),
+            probs=np.fromiter((w["probability"] for _, w in rows), dtype=np.float64, count=n),
+            seg_ids=np.fromiter((i for i, _ in rows), dtype=np.int32, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.seg_ids)
+
+    def segment_slice(self, seg_id: int) -> slice:
+        """Returns the row range belonging to one segment."""
+        lo, hi = np.searchsorted(self.seg_ids, [seg_id, seg_id + 1])
+        return slice(int(lo), int(hi))
+
+    def segment_tokens(self, seg_id: int) -> List[ASRToken]:
+        """Materializes the ASRToken objects of one segment on demand."""
+        rows = self.segment_slice(seg_id)
+        return [
+            ASRToken(start=s, end=e, token=t, probability=p)
+            for t, s, e, p in zip(
+                self.texts[rows].tolist(), self.starts[rows].tolist(),
+                self.ends[rows].tolist(), self.probs[rows].tolist(),
+            )
+        ]
+
+
 @dataclass
 class ASRResult:
     """Represents the final result from an ASR backend."""
     text: str
     segments: List[ASRSegment]
     language: Optional[str] = None
+    # When set, word-level tokens live here and segment.tokens is left empty.
+    arrays: Optional[ASRResultArrays] = None
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Returns the segment start/end times (float64) and texts as parallel columns."""
+        n = len(self.segments)
+        starts = np.fromiter((seg.start for seg in self.segments), dtype=np.float64, count=n)
+        ends = np.fromiter((seg.end for seg in self.segments), dtype=np.float64, count=n)
+        texts = [seg.text for seg in self.segments]
+        return starts, ends, texts
@@ -1,5 +1,8 @@
 import os
 import re
+import select
+import functools
+import itertools
 import subprocess
 from pathlib import Path
 from typing import Iterable
@@ -7,6 +10,42 @@ from typing import Iterable
 import yt_dlp
 
 
+# YouTube 網址（watch?v= 或 youtu.be），擷取 11 碼的 video id
+_YT_RE = re.compile(
+    r"(?:https?://)?"
+    r"(?:www\.)?"
+    r"(?:youtube\.com/watch\?v=|youtu\.be/)"
+    r"([\w\-]{11})"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _probe_audio_codec(path: str, mtime: float):
+    """以 ffprobe 取得第一條音軌的編碼名稱；結果依 (path, mtime) 快取，失敗時回傳 None。"""
+    try:
+        out = subprocess.run(
+            [
+                "ffprobe", "-v", "error", "-select_streams", "a:0",
+                "-show_entries", "stream=codec_name", "-of", "csv=p=0", path,
+            ],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+    except Exception:
+        return None
+    return out.stdout.strip() or None
+
+
+def _audio_codec_args(video_path, audio_format):
+    """依目標格式選擇編碼器：mp3 直接用 libmp3lame；m4a 只有來源已是 AAC 時才 copy。"""
+    if audio_format == "mp3":
+        return ["-acodec", "libmp3lame"]
+    if audio_format == "m4a":
+        source_codec = _probe_audio_codec(video_path, os.path.getmtime(video_path))
+        return ["-acodec", "copy" if source_codec == "aac" else "aac"]
+    # 其他格式交給 ffmpeg 依副檔名選擇預設編碼器
+    return []
+
+
 def extract_audio(video_path, audio_format="mp3"):
     """
     從影片檔案中提取音訊。
@@ -23,16 +62,16 @@ def extract_audio(video_path, audio_format="mp3"):
         if os.path.exists(audio_path):
             return audio_path
     
-        codec = "copy" if audio_format == "m4a" else "libmp3lame"
         command = [
-            "ffmpeg", "-i", video_path, "-vn", "-acodec", codec, "-y", audio_path,
+            "ffmpeg", "-i", video_path, "-vn",
+            *_audio_codec_args(video_path, audio_format), "-y", audio_path,
         ]
         subprocess.run(
             command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
         return audio_path
     except Exception:
-        # 如果 'copy' 編碼器失敗，嘗試不使用它
+        # 如果指定的編碼器失敗，嘗試不指定編碼器
         try:
             audio_path = os.path.splitext(video_path)[0] + f".{audio_format}"
             command = ["ffmpeg", "-i", video_path, "-vn", "-y", audio_path]
@@ -45,37 +84,150 @@ def extract_audio(video_path, audio_format="mp3"):
             return None
 
 
+def _open_audio_container(video_path: str):
+    """以 PyAV 開啟含音軌的媒體檔；未安裝 PyAV 或無法開啟時回傳 None。"""
+    try:
+        import av
+    except ImportError:
+        return None
+    try:
+        container = av.open(video_path)
+    except Exception as e:
+        print(f"[WARN] PyAV 無法開啟檔案，改用 ffmpeg 子行程: {e}")
+        return None
+    if not container.streams.audio:
+        container.close()
+        return None
+    return container
+
+
+def _pyav_pcm_chunks(container, sample_rate, sample_format, frame_bytes):
+    """在同一個行程內以 libav 解碼並重取樣成 mono PCM，填滿共用緩衝區後 yield。"""
+    import av
+
+    bytes_per_sample = 2 if sample_format == "s16le" else 4
+    resampler = av.AudioResampler(
+        format="s16" if sample_format == "s16le" else "flt",
+        layout="mono", rate=sample_rate,
+    )
+    buf = bytearray(frame_bytes)
+    view = memoryview(buf)
+    pos = 0
+    with container:
+        # 最後以 None 清空 resampler 內部殘留的取樣
+        for frame in itertools.chain(container.decode(audio=0), [None]):
+            for out in resampler.resample(frame):
+                # plane 緩衝區可能含對齊用的填充，只取有效取樣
+                data = memoryview(out.planes[0])[:out.samples * bytes_per_sample]
+                while data:
+                    n = min(frame_bytes - pos, len(data))
+                    view[pos:pos + n] = data[:n]
+                    pos += n
+                    data = data[n:]
+                    if pos == frame_bytes:
+                        yield view
+                        pos = 0
+    if pos:
+        yield view[:pos]
+
+
+def _read_whole_samples(read_into, frame_bytes, bytes_per_sample):
+    """
+    以 read_into 重複讀入共用緩衝區，只 yield 完整取樣的部分。
+
+    read_into(view) 的語意同 RawIOBase.readinto：回傳讀到的位元組數、0 表示 EOF、
+    None 表示暫無資料。非阻塞讀取可能只讀到半個取樣，剩下的位元組會搬到緩衝區開頭，
+    與下一次讀到的資料接上；EOF 時不完整的尾端取樣直接捨棄。
+    """
+    buf = bytearray(frame_bytes)
+    view = memoryview(buf)
+    carry = 0
+    while True:
+        n = read_into(view[carry:])
+        if n is None:
+            continue
+        if not n:
+            break
+        total = carry + n
+        whole = total - total % bytes_per_sample
+        if whole:
+            yield view[:whole]
+        carry = total - whole
+        if carry:
+            buf[:carry] = buf[whole:total]
+
+
 def extract_audio_chunks_from_video(
     video_path: str,
     chunk_sec: float = 1.2,
-) -> Iterable[bytes]:
-    """以串流方式，從影片解出 s16le/16k/mono PCM，並以 chunk_sec 為單位 yield。"""
-    assert Path(video_path).is_file(), f"File not found: {video_path}"
-    
+    legacy_s16: bool = True,
+    low_latency: bool = False,
+) -> Iterable[memoryview]:
+    """
+    以串流方式，從影片解出 16k/mono PCM，並以 chunk_sec 為單位 yield。
+
+    legacy_s16 為 True 時輸出 s16le；為 False 時由 ffmpeg 直接輸出 f32le，
+    下游可直接以 np.frombuffer(..., dtype=np.float32) 取用，省去 int16→float32 轉換。
+
+    為避免每個 chunk 都配置新的 bytes，所有 chunk 共用同一塊預先配置的緩衝區，
+    yield 的是其 memoryview；內容只在下一次迭代前有效，需保留時請自行複製
+    （StreamingTranscriber.stream_transcribe 會立即將其複製進內部緩衝區）。
+
+    low_latency 供即時來源（串流 URL、擷取裝置）使用：ffmpeg 略過探測與輸入緩衝、
+    每個封包立即輸出，並以非阻塞方式讀取，有多少完整取樣就先 yield 多少，
+    不等湊滿 chunk_sec。對一般檔案反而可能探測不到音軌資訊，預設關閉；
+    目前專案內沒有任何呼叫端使用此模式。
+
+    一般檔案優先以 PyAV 在行程內解碼，省去啟動 ffmpeg 子行程與 pipe 的開銷；
+    未安裝 PyAV 或無法開啟時退回 ffmpeg 子行程。
+    """
+    if not low_latency:
+        assert Path(video_path).is_file(), f"File not found: {video_path}"
+
     SR = 16000
-    bytes_per_sec = SR * 2  # s16le, 1ch
-    frame_bytes = int(bytes_per_sec * chunk_sec)
+    sample_format = "s16le" if legacy_s16 else "f32le"
+    bytes_per_sample = 2 if legacy_s16 else 4  # 1ch
+    frame_bytes = int(SR * bytes_per_sample * chunk_sec)
+    # chunk 一律落在完整取樣上
+    frame_bytes = max(bytes_per_sample, frame_bytes - frame_bytes % bytes_per_sample)
+
+    container = None if low_latency else _open_audio_container(video_path)
+    if container is not None:
+        yield from _pyav_pcm_chunks(container, SR, sample_format, frame_bytes)
+        return
 
     command = [
         "ffmpeg",
         "-hide_banner", "-nostdin", "-loglevel", "warning",
+        *(
+            ["-probesize", "32", "-analyzeduration", "0", "-fflags", "+nobuffer"]
+            if low_latency else []
+        ),
         "-i", video_path,
         "-vn",
         "-ac", "1", "-ar", str(SR),
-        "-acodec", "pcm_s16le",
-        "-f", "s16le",
+        "-acodec", f"pcm_{sample_format}",
+        "-f", sample_format,
+        *(["-flush_packets", "1"] if low_latency else []),
         "-"
     ]
     proc = subprocess.Popen(
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=10**6
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        bufsize=0 if low_latency else 10**6
     )
-    
+    if low_latency:
+        os.set_blocking(proc.stdout.fileno(), False)
+
+    def read_into(view):
+        if low_latency:
+            ready, _, _ = select.select([proc.stdout], [], [], 0.02)
+            if not ready:
+                return None
+        # 非阻塞模式下暫時沒有資料時回傳 None
+        return proc.stdout.readinto(view)
+
     try:
-        while True:
-            chunk = proc.stdout.read(frame_bytes)
-            if not chunk:
-                break
-            yield chunk
+        yield from _read_whole_samples(read_into, frame_bytes, bytes_per_sample)
     finally:
         try:
             proc.terminate()
@@ -109,13 +261,7 @@ def download_youtube_video(
         error_message (str): 錯誤訊息，若成功則為 None。
     """
     # 解析 YouTube video id
-    pattern = (
-        r"(?:https?://)?"
-        r"(?:www\.)?"
-        r"(?:youtube\.com/watch\?v=|youtu\.be/)"
-        r"([\w\-]{11})"
-    )
-    match = re.match(pattern, url.strip())
+    match = _YT_RE.match(url.strip())
     if not match:
         return None, None, "請輸入合法的 YouTube 連結"
 
@@ -123,7 +269,8 @@ def download_youtube_video(
     video_id = match.group(1)
     os.makedirs(output_dir, exist_ok=True)
 
-    base_filename = filename if filename != "" else video_id
+    # 預設檔名包含畫質，避免以不同畫質請求時誤用先前下載的快取檔案
+    base_filename = filename if filename != "" else f"{video_id}_{yt_quality}"
     video_filepath = os.path.join(output_dir, f"{base_filename}.mp4")
     audio_filepath = os.path.join(
         output_dir, f"{base_filename}.{extract_audio_format}"
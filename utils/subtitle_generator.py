@@ -1,24 +1,47 @@
 import os
 import json
+from contextlib import ExitStack
+from itertools import repeat
+from typing import Optional
+
+import numpy as np
+
+try:
+    # orjson ships with gradio; fall back to the stdlib encoder without it
+    import orjson
+except ImportError:
+    orjson = None
 
 from .dataclasses import ASRResult
 
 
+# Larger write buffer for subtitle files, fewer write() syscalls on long transcripts
+_WRITE_BUFFER = 64 * 1024
+
+
 def _format_timestamp(seconds: float) -> str:
     """Converts seconds to SRT/VTT timestamp format."""
     assert seconds >= 0, "non-negative timestamp expected"
-    milliseconds = round(seconds * 1000.0)
-
-    hours = milliseconds // 3_600_000
-    milliseconds %= 3_600_000
-
-    minutes = milliseconds // 60_000
-    milliseconds %= 60_000
+    hours, milliseconds = divmod(round(seconds * 1000.0), 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    seconds, milliseconds = divmod(milliseconds, 1_000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
 
-    seconds = milliseconds // 1_000
-    milliseconds %= 1_000
 
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+def _format_timestamps_vec(seconds_arr: np.ndarray) -> list:
+    """Vectorized _format_timestamp for many timestamps at once."""
+    assert (seconds_arr >= 0).all(), "non-negative timestamp expected"
+    # np.rint rounds half to even, the same as round() in _format_timestamp
+    ms = np.rint(seconds_arr * 1000.0).astype(np.int64)
+    hours, ms = np.divmod(ms, 3_600_000)
+    minutes, ms = np.divmod(ms, 60_000)
+    seconds, ms = np.divmod(ms, 1_000)
+    return [
+        f"{h:02d}:{m:02d}:{s:02d},{x:03d}"
+        for h, m, s, x in zip(
+            hours.tolist(), minutes.tolist(), seconds.tolist(), ms.tolist()
+        )
+    ]
 
 
 def save_as_srt(result: ASRResult, audio_path: str):
@@ -28,16 +51,7 @@ def save_as_srt(result: ASRResult, audio_path: str):
         return None
 
     output_path = os.path.splitext(audio_path)[0] + ".srt"
-    with open(output_path, "w", encoding="utf-8") as srt_file:
-        for i, segment in enumerate(result.segments):
-            start_time = _format_timestamp(segment.start)
-            end_time = _format_timestamp(segment.end)
-            text = segment.text.strip()
-            if segment.speaker:
-                text = f"[{segment.speaker}] {text}"
-            srt_file.write(f"{i + 1}\n")
-            srt_file.write(f"{start_time} --> {end_time}\n")
-            srt_file.write(f"{text}\n\n")
+    _write_subtitles(result, srt_path=output_path)
     return output_path
 
 
@@ -48,65 +62,184 @@ def save_as_vtt(result: ASRResult, audio_path: str):
         return None
 
     output_path = os.path.splitext(audio_path)[0] + ".vtt"
-    with open(output_path, "w", encoding="utf-8") as vtt_file:
-        vtt_file.write("WEBVTT\n\n")
-        for segment in result.segments:
-            start_time = _format_timestamp(segment.start).replace(",", ".")
-            end_time = _format_timestamp(segment.end).replace(",", ".")
-            text = segment.text.strip()
-            if segment.speaker:
-                text = f"[{segment.speaker}] {text}"
-            vtt_file.write(f"{start_time} --> {end_time}\n")
-            vtt_file.write(f"{text}\n\n")
-    
+    _write_subtitles(result, vtt_path=output_path)
     return output_path
 
 
 def save_as_txt(result: ASRResult, audio_path: str):
     """Saves the transcription result in TXT format."""
     output_path = os.path.splitext(audio_path)[0] + ".txt"
+    return _write_txt(result, output_path)
+
+
+def _write_txt(result: ASRResult, output_path: str):
     with open(output_path, "w", encoding="utf-8") as txt_file:
         txt_file.write(result.text.strip())
     return output_path
 
 
+def _segment_token_dicts(result: ASRResult):
+    """Yields the JSON token list of each segment, reading columns directly when available."""
+    arrays = result.arrays
+    if arrays is None:
+        for seg in result.segments:
+            yield [
+                {
+                    "start": tok.start,
+                    "end": tok.end,
+                    "token": tok.token,
+                    "probability": tok.probability,
+                }
+                for tok in seg.tokens
+            ]
+        return
+
+    texts = arrays.texts.tolist()
+    starts = arrays.starts.tolist()
+    ends = arrays.ends.tolist()
+    probs = arrays.probs.tolist()
+    bounds = np.searchsorted(arrays.seg_ids, np.arange(len(result.segments) + 1)).tolist()
+    for lo, hi in zip(bounds, bounds[1:]):
+        yield [
+            {"start": s, "end": e, "token": t, "probability": p}
+            for t, s, e, p in zip(texts[lo:hi], starts[lo:hi], ends[lo:hi], probs[lo:hi])
+        ]
+
+
+def _segment_json(segment, tokens) -> dict:
+    return {
+        "start": segment.start,
+        "end": segment.end,
+        "text": segment.text,
+        "speaker": segment.speaker,
+        "tokens": tokens,
+    }
+
+
+def _json_default(obj):
+    """Converts numpy scalars (e.g. faster-whisper's np.float64 word times) to Python values."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> bytes:
+    """Serializes obj as UTF-8 JSON with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(
+        obj, indent=2, ensure_ascii=False, default=_json_default
+    ).encode("utf-8")
+
+
+class _JsonStreamWriter:
+    """
+    Writes the transcript JSON one segment at a time.
+
+    Only the current segment's dict is held in memory; the file has the same
+    layout as dumping the full {"text", "language", "segments"} dict at once.
+    """
+
+    def __init__(self, json_file, result: ASRResult):
+        self._file = json_file
+        self._count = 0
+        header = _dumps({"text": result.text, "language": result.language})
+        # Keep the header's members, drop its closing brace
+        self._file.write(header[:header.rindex(b"}")].rstrip())
+        self._file.write(b',\n  "segments": [')
+
+    def write_segment(self, segment_dict: dict):
+        body = _dumps(segment_dict).replace(b"\n", b"\n    ")
+        self._file.write(b",\n    " if self._count else b"\n    ")
+        self._file.write(body)
+        self._count += 1
+
+    def close(self):
+        self._file.write(b"\n  ]\n}" if self._count else b"]\n}")
+
+
 def save_as_json(result: ASRResult, audio_path: str):
     """Saves the transcription result in JSON format."""
     output_path = os.path.splitext(audio_path)[0] + ".json"
-    # Convert ASRResult to a dictionary for JSON serialization
-    result_dict = {
-        "text": result.text,
-        "language": result.language,
-        "segments": [
-            {
-                "start": seg.start,
-                "end": seg.end,
-                "text": seg.text,
-                "speaker": seg.speaker,
-                "tokens": [
-                    {
-                        "start": tok.start,
-                        "end": tok.end,
-                        "token": tok.token,
-                        "probability": tok.probability,
-                    }
-                    for tok in seg.tokens
-                ],
-            }
-            for seg in result.segments
-        ],
-    }
-    with open(output_path, "w", encoding="utf-8") as json_file:
-        json.dump(result_dict, json_file, indent=4, ensure_ascii=False)
-    
+    with open(output_path, "wb", buffering=_WRITE_BUFFER) as json_file:
+        writer = _JsonStreamWriter(json_file, result)
+        for seg, tokens in zip(result.segments, _segment_token_dicts(result)):
+            writer.write_segment(_segment_json(seg, tokens))
+        writer.close()
     return output_path
 
 
 def save_transcription_results(result: ASRResult, audio_path: str):
-    """Saves the transcription result in all supported formats."""
-    srt_path = save_as_srt(result, audio_path)
-    vtt_path = save_as_vtt(result, audio_path)
-    txtx_path = save_as_txt(result, audio_path)
-    json_path = save_as_json(result, audio_path)
+    """
+    Saves the transcription result in all supported formats.
+
+    SRT, VTT and JSON are written in a single pass over the segments,
+    formatting each timestamp only once and streaming the JSON segments.
+    """
+    base_path = os.path.splitext(audio_path)[0]
+    srt_path = vtt_path = None
+    json_path = base_path + ".json"
+
+    with open(json_path, "wb", buffering=_WRITE_BUFFER) as json_file:
+        json_writer = _JsonStreamWriter(json_file, result)
+        if result.segments:
+            srt_path = base_path + ".srt"
+            vtt_path = base_path + ".vtt"
+            _write_subtitles(result, srt_path, vtt_path, json_writer)
+        else:
+            print("Warning: No segments found, cannot generate SRT file.")
+            print("Warning: No segments found, cannot generate VTT file.")
+        json_writer.close()
+
+    txtx_path = _write_txt(result, base_path + ".txt")
 
     return [srt_path, vtt_path, txtx_path, json_path]
+
+
+def _write_subtitles(
+    result: ASRResult,
+    srt_path: Optional[str] = None,
+    vtt_path: Optional[str] = None,
+    json_writer: Optional[_JsonStreamWriter] = None,
+):
+    """
+    Writes the requested SRT/VTT files and JSON segments in one pass.
+
+    Each output is optional, so every subtitle format goes through the same
+    formatting code.
+    """
+    with ExitStack() as stack:
+        srt_file = vtt_file = None
+        if srt_path is not None:
+            srt_file = stack.enter_context(
+                open(srt_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER)
+            )
+        if vtt_path is not None:
+            vtt_file = stack.enter_context(
+                open(vtt_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER)
+            )
+            vtt_file.write("WEBVTT\n\n")
+
+        starts, ends, _ = result.to_arrays()
+        start_times = _format_timestamps_vec(starts)
+        end_times = _format_timestamps_vec(ends)
+        tokens_iter = (
+            _segment_token_dicts(result) if json_writer is not None
+            else repeat(None)
+        )
+        segments = zip(result.segments, tokens_iter, start_times, end_times)
+        for i, (segment, tokens, start_time, end_time) in enumerate(segments, start=1):
+            text = segment.text.strip()
+            if segment.speaker:
+                text = f"[{segment.speaker}] {text}"
+            if srt_file is not None:
+                srt_file.write(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
+            if vtt_file is not None:
+                vtt_file.write(
+                    f"{start_time.replace(',', '.')} --> "
+                    f"{end_time.replace(',', '.')}\n{text}\n\n"
+                )
+            if json_writer is not None:
+                json_writer.write_segment(_segment_json(segment, tokens))